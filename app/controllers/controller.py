@@ -1,9 +1,22 @@
-from fastapi import APIRouter
-from app.db.session import get_db 
-from app.services.sql_lite_service import get_entity_count
+import hashlib
+import json
+from fastapi import APIRouter, Query, Request, Response
+from app.db.session import get_db
+from app.models.schemas import EntityCountResponse, EntityListResponse
+from app.services.sql_lite_service import get_entity_count, get_entity_page
 
 router = APIRouter()
 
+def check_etag(request: Request, response: Response, payload):
+    # Hash the payload into an ETag; matching If-None-Match clients get
+    # an empty 304 instead of the full body
+    body = json.dumps(payload, sort_keys=True, default=str).encode()
+    etag = '"' + hashlib.md5(body).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return payload
+
 @router.get("/")
 async def root():
     return {"status": "ok", "message": "Fashia Backend API"}
@@ -17,10 +30,21 @@ async def health():
     return {"status": "ok", "service": "Fashia Backend API"}
 
 
-@router.get("/entities/count")
-def read_entity_count():
+@router.get("/entities", response_model=EntityListResponse)
+def read_entities(
+    request: Request,
+    response: Response,
+    after_id: int = Query(0, ge=0),
+    per_page: int = Query(25, gt=0, le=100),
+):
+    entities = get_entity_page(after_id, per_page)
+    next_cursor = entities[-1]["id"] if len(entities) == per_page else None
+    return check_etag(request, response, {"entities": entities, "next_cursor": next_cursor})
+
+@router.get("/entities/count", response_model=EntityCountResponse)
+def read_entity_count(request: Request, response: Response):
     count = get_entity_count()
-    return {"count": count}
+    return check_etag(request, response, {"count": count})
 
 @router.get("/hello/dev")
 def read_entity_count():
@@ -1 +1,11 @@
-ENTITY_TABLE_COUNT_QUERY = "SELECT COUNT(*) FROM entities;"
\ No newline at end of file
+ENTITY_TABLE_COUNT_QUERY = "SELECT COUNT(*) FROM entities;"
+ENTITY_SUMMARY_COUNT_QUERY = "SELECT record_count FROM table_counts WHERE table_name = 'entities';"
+# Explicit projection: list only what the listing consumers render,
+# leaving out internal columns like address_hash
+ENTITY_PAGE_COLUMNS = (
+    "id, name, ccn_or_npi, type, subtype, address, city, state_id, "
+    "zip_code, latitude, longitude"
+)
+ENTITY_PAGE_QUERY = (
+    "SELECT " + ENTITY_PAGE_COLUMNS + " FROM entities WHERE id > ? ORDER BY id LIMIT ?;"
+)
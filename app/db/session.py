@@ -1,21 +1,106 @@
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 import app.db.db_query as db_query
 DB_FOLDER_PATH="/mnt/efs"
 DATABASE_PATH = DB_FOLDER_PATH+"/facilities.db"
 
+# Small bounded pool of read-only connections, created lazily on first
+# use. Handlers run in the FastAPI threadpool, so a few connections let
+# concurrent requests read in parallel instead of serializing on one.
+POOL_SIZE = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _connect():
+    # SQL lives as fixed strings in db_query.py, so the per-connection
+    # statement cache gets a hit (no re-prepare) on every request now
+    # that connections are reused
+    conn = sqlite3.connect(
+        "file:" + DATABASE_PATH + "?mode=ro",
+        uri=True,
+        check_same_thread=False,
+        cached_statements=32,
+    )
+    # Read-path tuning, set once per pooled connection: mmap lets the
+    # kernel page cache serve reads without read() syscalls, and a
+    # bigger page cache keeps the hot b-tree pages resident. WAL is
+    # deliberately not enabled — the file is opened read-only and lives
+    # on EFS, where WAL's shared-memory index is unsafe.
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA mmap_size = 268435456;")
+    cursor.execute("PRAGMA cache_size = -64000;")
+    cursor.execute("PRAGMA temp_store = MEMORY;")
+    # Don't fail immediately if the importer briefly holds the file
+    cursor.execute("PRAGMA busy_timeout = 5000;")
+    cursor.close()
+    return conn
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Build into a local queue and publish it only once every
+            # connection opened, so a failure (EFS mount not ready, file
+            # missing) leaves _pool as None and the next request retries
+            # instead of blocking forever on a half-filled pool
+            connections = []
+            try:
+                for _ in range(POOL_SIZE):
+                    connections.append(_connect())
+            except Exception:
+                for conn in connections:
+                    conn.close()
+                raise
+            pool = queue.Queue(maxsize=POOL_SIZE)
+            for conn in connections:
+                pool.put(conn)
+            _pool = pool
+    return _pool
+
+@contextmanager
 def get_db():
-    return sqlite3.connect(DATABASE_PATH)
+    pool = _get_pool()
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        pool.put(conn)
 
 
 def get_entity_table_count():
-    conn = get_db()
-    cursor = conn.cursor()
+    with get_db() as conn:
+        cursor = conn.cursor()
 
-    # Execute count query
-    cursor.execute(db_query.ENTITY_TABLE_COUNT_QUERY)
-    count = cursor.fetchone()[0]
+        # Prefer the summary table maintained by the data importer so the
+        # unfiltered count does not scan the whole entities table
+        try:
+            cursor.execute(db_query.ENTITY_SUMMARY_COUNT_QUERY)
+            row = cursor.fetchone()
+        except sqlite3.OperationalError:
+            # Older database files don't have the table_counts summary yet
+            row = None
 
-    print(f"Total records: {count}")
+        if row is not None:
+            count = row[0]
+        else:
+            # Execute count query
+            cursor.execute(db_query.ENTITY_TABLE_COUNT_QUERY)
+            count = cursor.fetchone()[0]
 
-    conn.close()
     return count
+
+
+def get_entity_table_page(after_id, limit):
+    with get_db() as conn:
+        cursor = conn.cursor()
+
+        # Keyset pagination: seek past the last id from the previous page
+        # instead of OFFSET, so deep pages stay index-seek cheap
+        cursor.execute(db_query.ENTITY_PAGE_QUERY, (after_id, limit))
+        columns = [description[0] for description in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    return rows
@@ -1,12 +1,18 @@
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from app.controllers.controller import router
 from app.config import settings
+from app.services.sql_lite_service import get_entity_count
 
 app = FastAPI(
     title="Fashia Backend API",
     description="Backend API for Fashia application",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -18,5 +24,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies over 1KB for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(router)
+
+@app.on_event("startup")
+def warm_up():
+    # Build the connection pool and prime the count cache so the first
+    # real request doesn't pay the cold-start cost
+    # The EFS mount may not be ready yet; the pool is only published
+    # once fully built, so the first request rebuilds it and retries
+    try:
+        get_entity_count()
+    except Exception:
+        logging.getLogger(__name__).exception("warm-up failed; deferring to first request")
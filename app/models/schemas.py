@@ -0,0 +1,22 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+class EntitySummary(BaseModel):
+    id: int
+    name: Optional[str] = None
+    ccn_or_npi: Optional[str] = None
+    type: Optional[str] = None
+    subtype: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state_id: Optional[int] = None
+    zip_code: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+class EntityListResponse(BaseModel):
+    entities: List[EntitySummary]
+    next_cursor: Optional[int] = None
+
+class EntityCountResponse(BaseModel):
+    count: int
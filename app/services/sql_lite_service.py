@@ -1,4 +1,39 @@
-from app.db.session import get_entity_table_count
+import threading
+import time
+from app.db.session import get_entity_table_count, get_entity_table_page
+
+# Small in-process TTL cache for GET responses. The database only
+# changes when the importer publishes a new file, so serving slightly
+# stale reads for a short window is fine and skips the EFS round trip.
+CACHE_TTL_SECONDS = 30
+CACHE_MAX_ENTRIES = 1024
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def _cached(key, loader):
+    now = time.monotonic()
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    # Single-flight: when an entry expires under load, let one request
+    # rebuild it while the rest wait and reuse the fresh value instead
+    # of all stampeding the database at once
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = loader()
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            _cache.clear()
+        _cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+    return value
 
 def get_entity_count():
-    return get_entity_table_count()
\ No newline at end of file
+    return _cached("entity_count", get_entity_table_count)
+
+def get_entity_page(after_id, limit):
+    return _cached(
+        ("entity_page", after_id, limit),
+        lambda: get_entity_table_page(after_id, limit),
+    )